@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import datetime
 import enum
 import itertools
@@ -16,6 +15,11 @@ from xarray.core.indexing import IndexSelResult, merge_sel_results
 Timestamp = str | datetime.datetime | pd.Timestamp | np.datetime64
 Timedelta = str | datetime.timedelta | np.timedelta64  # TODO: pd.DateOffset also?
 
+_ZERO_TD = pd.Timedelta(0)
+# HRRR runs off the 6-hourly cycle only forecast out to 18 hours.
+_HRRR_MAX_BASE_LEAD = pd.Timedelta("18h")
+_NP_18H = _HRRR_MAX_BASE_LEAD.to_timedelta64()
+
 
 ####################
 ####  Indexer types
@@ -37,18 +41,25 @@ class ModelRun:
         Initialization time for model run
     """
 
+    __slots__ = ("_offcycle_hour", "time")
+
     time: pd.Timestamp
 
     def __init__(self, time: Timestamp):
         self.time = pd.Timestamp(time)
+        self._offcycle_hour = bool(self.time.hour % 6)
 
     def get_indexer(
-        self, model: Model | None, time_index: pd.DatetimeIndex, period_index: pd.TimedeltaIndex
+        self,
+        model: Model | None,
+        time_index: pd.DatetimeIndex,
+        period_index: pd.TimedeltaIndex,
+        cache: IndexCache,
     ) -> tuple[int, slice]:
         time_idxr = time_index.get_loc(self.time)
         period_idxr = slice(None)
 
-        if model is Model.HRRR and self.time.hour % 6 != 0:
+        if model is Model.HRRR and self._offcycle_hour:
             period_idxr = slice(19)
 
         return time_idxr, period_idxr
@@ -62,21 +73,28 @@ class ConstantOffset:
     `forecast_period`.
     """
 
+    __slots__ = ("_over_18h", "step")
+
     step: pd.Timedelta
 
     def __init__(self, step: Timedelta):
         self.step = pd.Timedelta(step)
+        self._over_18h = bool(self.step > _HRRR_MAX_BASE_LEAD)
 
     def get_indexer(
-        self, model: Model | None, time_index: pd.DatetimeIndex, period_index: pd.TimedeltaIndex
+        self,
+        model: Model | None,
+        time_index: pd.DatetimeIndex,
+        period_index: pd.TimedeltaIndex,
+        cache: IndexCache,
     ) -> tuple[slice | np.ndarray, int]:
         time_idxr = slice(None)
-        (period_idxr,) = period_index.get_indexer([self.step])
+        period_idxr = cache.period_pos.get(self.step)
+        if period_idxr is None:
+            (period_idxr,) = period_index.get_indexer([self.step])
 
-        if model is Model.HRRR and self.step.total_seconds() / 3600 > 18:
-            model_mask = np.ones(time_index.shape, dtype=bool)
-            model_mask[time_index.hour % 6 != 0] = False
-            time_idxr = np.arange(time_index.size)[model_mask]
+        if model is Model.HRRR and self._over_18h:
+            time_idxr = np.flatnonzero(cache.hrrr_base_run_mask)
 
         return time_idxr, period_idxr
 
@@ -92,49 +110,76 @@ class ConstantForecast:
 
     """
 
+    __slots__ = ("time",)
+
     time: pd.Timestamp
 
     def __init__(self, time: Timestamp):
         self.time = pd.Timestamp(time)
 
     def get_indexer(
-        self, model: Model | None, time_index: pd.DatetimeIndex, period_index: pd.TimedeltaIndex
+        self,
+        model: Model | None,
+        time_index: pd.DatetimeIndex,
+        period_index: pd.TimedeltaIndex,
+        cache: IndexCache,
     ) -> tuple[np.ndarray, np.ndarray]:
         target = self.time
+        empty = np.empty(0, dtype=np.intp)
+
+        # time_index is assumed monotonic increasing, so we binary search
+        # the raw values instead of going through `get_slice_bound`.
+        # time_values are naive (UTC for a tz-aware index), so check tz-awareness
+        # matches before converting, as `get_slice_bound` did.
+        if (target.tz is None) != (time_index.tz is None):
+            raise TypeError("Cannot compare tz-naive and tz-aware datetime-like objects")
+        time_values = cache.time_values
+        target_np = target.to_datetime64()
+
+        # No model runs at all, or none initialized before the requested time.
+        if not time_values.size or target_np < time_values[0]:
+            return empty, empty
+
         max_timedelta = period_index[-1]
 
         # earliest timestep we can start at
         earliest = target - max_timedelta
-        left = time_index.get_slice_bound(earliest, side="left")
+        left = time_values.searchsorted(earliest.to_datetime64(), side="left")
 
         # latest we can get
-        right = time_index.get_slice_bound(target, side="right")
+        right = time_values.searchsorted(target_np, side="right")
 
-        needed_times = time_index[slice(left, right)]
-        needed_steps = target - needed_times  # type: ignore
-        # print(needed_times, needed_steps)
+        if left >= right:
+            return empty, empty
+
+        # Work on raw ndarrays so the HRRR filter below is a plain NumPy expression.
+        needed_times = time_values[left:right]
+        needed_steps = target_np - needed_times
 
         needed_time_idxs = np.arange(left, right)
-        needed_step_idxs = period_index.get_indexer(needed_steps)
-        model_mask = np.ones(needed_time_idxs.shape, dtype=bool)
+
+        # It's possible we don't have the right step.
+        # period_index is assumed monotonic increasing, so binary search it
+        # and keep only exact matches. A step past the end is clipped onto the
+        # last period, which can't compare equal.
+        period_values = cache.period_values
+        needed_step_idxs = period_values.searchsorted(needed_steps)
+        keep = period_values[needed_step_idxs.clip(max=period_values.size - 1)] == needed_steps
 
         # TODO: refactor this out
         if model is Model.HRRR:
-            model_mask[(needed_times.hour != 6) & (needed_steps > pd.to_timedelta("18h"))] = False
+            keep &= ~((cache.hour[left:right] != 6) & (needed_steps > _NP_18H))
 
-        # It's possible we don't have the right step.
-        # If pandas doesn't find an exact match it returns -1.
-        mask = needed_step_idxs != -1
-
-        needed_step_idxs = needed_step_idxs[model_mask & mask]
-        needed_time_idxs = needed_time_idxs[model_mask & mask]
+        sel = np.flatnonzero(keep)
+        needed_step_idxs = needed_step_idxs[sel]
+        needed_time_idxs = needed_time_idxs[sel]
 
         assert needed_step_idxs.size == needed_time_idxs.size
 
         return needed_time_idxs, needed_step_idxs
 
 
-@dataclass
+@dataclass(slots=True)
 class BestEstimate:
     """
     For each forecast time in the collection, the best estimate for that hour is used to create a
@@ -155,9 +200,13 @@ class BestEstimate:
             )
 
     def get_indexer(
-        self, model: Model | None, time_index: pd.DatetimeIndex, period_index: pd.TimedeltaIndex
+        self,
+        model: Model | None,
+        time_index: pd.DatetimeIndex,
+        period_index: pd.TimedeltaIndex,
+        cache: IndexCache,
     ) -> tuple[np.ndarray, np.ndarray]:
-        if period_index[0] != pd.Timedelta(0):
+        if period_index[0] != _ZERO_TD:
             raise ValueError(
                 "Can't make a best estimate dataset if forecast_period doesn't start at 0."
             )
@@ -171,25 +220,23 @@ class BestEstimate:
         last_index = time_index.size - 1 if self.asof is None else time_index.get_loc(self.asof)
 
         # TODO: refactor to a Model dataclass that does this filtering appropriately.
-        if model is Model.HRRR and time_index[last_index].hour % 6 != 0:
+        if model is Model.HRRR and not cache.hrrr_base_run_mask[last_index]:
             nsteps = 19
         else:
             nsteps = period_index.size
 
-        needed_time_idxrs = np.concatenate(
-            [
-                np.arange(first_index, last_index, dtype=int),
-                np.repeat(last_index, nsteps),
-            ]
-        )
-        needed_step_idxrs = np.concatenate(
-            [np.zeros((last_index - first_index,), dtype=int), np.arange(nsteps)]
-        )
+        # Build each array with a single allocation: the time indexer counts up to
+        # `last_index` and then repeats it; the step indexer is zero until then.
+        n = last_index - first_index
+        needed_time_idxrs = np.arange(first_index, last_index + nsteps, dtype=np.intp)
+        needed_time_idxrs[n:] = last_index
+        needed_step_idxrs = np.zeros(n + nsteps, dtype=np.intp)
+        needed_step_idxrs[n:] = np.arange(nsteps)
 
         return needed_time_idxrs, needed_step_idxrs
 
 
-@dataclass
+@dataclass(slots=True)
 class Indexes:
     reference_time: PandasIndex
     period: PandasIndex
@@ -199,6 +246,131 @@ class Indexes:
         return {"reference_time": self.reference_time.index.name, "period": self.period.index.name}
 
 
+@dataclass(frozen=True, slots=True)
+class IndexCache:
+    """
+    Arrays derived from `Indexes` that are reused by the indexers on every `.sel` call.
+    ForecastIndex is immutable, so these are computed once at construction.
+    """
+
+    # raw datetime64 values of reference_time
+    time_values: np.ndarray
+    # HRRR only: hour of day for each reference_time, and whether
+    # that run is on the 6-hourly cycle. None for other models.
+    hour: np.ndarray | None
+    hrrr_base_run_mask: np.ndarray | None
+    # raw timedelta64 values of forecast_period
+    period_values: np.ndarray
+    # position of each forecast_period, for scalar lookups
+    period_pos: dict[pd.Timedelta, int]
+
+    @classmethod
+    def from_indexes(cls, indexes: Indexes, model: Model | None) -> IndexCache:
+        time_index = indexes.reference_time.index
+        period_index = indexes.period.index
+
+        hour = hrrr_base_run_mask = None
+        if model is Model.HRRR:
+            if time_index.tz is None:
+                # Casting to hours since the epoch is cheaper than DatetimeIndex.hour
+                hour = time_index.values.astype("datetime64[h]").astype(np.int64) % 24
+            else:
+                hour = time_index.hour.to_numpy()
+            hrrr_base_run_mask = hour % 6 == 0
+
+        return cls(
+            time_values=time_index.values,
+            hour=hour,
+            hrrr_base_run_mask=hrrr_base_run_mask,
+            period_values=period_index.values,
+            period_pos=_period_positions(period_index),
+        )
+
+    def isel(self, indexes: Indexes, time_idxr=None, period_idxr=None) -> IndexCache:
+        """
+        Cache for `indexes`, which were obtained by indexing the parent's indexes with
+        `time_idxr` and `period_idxr` (None for an axis that was not selected).
+        Subsets the parent's arrays instead of recomputing them.
+        """
+        time_values, hour, hrrr_base_run_mask = self.time_values, self.hour, self.hrrr_base_run_mask
+        if time_idxr is not None:
+            time_values = time_values[time_idxr]
+            if hour is not None:
+                hour = hour[time_idxr]
+                hrrr_base_run_mask = hrrr_base_run_mask[time_idxr]
+
+        period_values, period_pos = self.period_values, self.period_pos
+        if period_idxr is not None:
+            period_values = period_values[period_idxr]
+            period_pos = _period_positions(indexes.period.index)
+
+        return type(self)(
+            time_values=time_values,
+            hour=hour,
+            hrrr_base_run_mask=hrrr_base_run_mask,
+            period_values=period_values,
+            period_pos=period_pos,
+        )
+
+
+def _period_positions(period_index: pd.TimedeltaIndex) -> dict[pd.Timedelta, int]:
+    return dict(zip(period_index, range(period_index.size), strict=True))
+
+
+####################
+####  FMRC-style `.sel` handlers
+# Each returns (dim_indexers, indexes, variables, valid_time_dim).
+# valid_time_dim is None if no `valid_time` coordinate should be added.
+
+_HandlerResult = tuple[dict, dict, dict, Hashable | None]
+
+
+def _handle_constant_offset(
+    indexes: Indexes, time_name: Hashable, period_name: Hashable, time_idxr, period_idxr
+) -> _HandlerResult:
+    indexer = {time_name: time_idxr, period_name: period_idxr}
+    return indexer, {time_name: indexes.reference_time[time_idxr]}, {}, time_name
+
+
+def _handle_model_run(
+    indexes: Indexes, time_name: Hashable, period_name: Hashable, time_idxr, period_idxr
+) -> _HandlerResult:
+    indexer = {time_name: time_idxr, period_name: period_idxr}
+    return indexer, {period_name: indexes.period[period_idxr]}, {}, period_name
+
+
+def _handle_constant_forecast(
+    indexes: Indexes, time_name: Hashable, period_name: Hashable, time_idxr, period_idxr
+) -> _HandlerResult:
+    indexer = {
+        time_name: xr.Variable(time_name, time_idxr),
+        period_name: xr.Variable(time_name, period_idxr),
+    }
+    # TODO: also return a scalar `valid_time` variable holding the requested
+    # ConstantForecast time; adding it currently triggers a bug.
+    return indexer, {time_name: indexes.reference_time[time_idxr]}, {}, None
+
+
+def _handle_best_estimate(
+    indexes: Indexes, time_name: Hashable, period_name: Hashable, time_idxr, period_idxr
+) -> _HandlerResult:
+    indexer = {
+        time_name: xr.Variable("valid_time", time_idxr),
+        period_name: xr.Variable("valid_time", period_idxr),
+    }
+    return indexer, {}, {}, "valid_time"
+
+
+# Dispatch on the exact label type; this is a single dict lookup
+# instead of a chain of isinstance checks.
+_SEL_HANDLERS = {
+    ConstantOffset: _handle_constant_offset,
+    ModelRun: _handle_model_run,
+    ConstantForecast: _handle_constant_forecast,
+    BestEstimate: _handle_best_estimate,
+}
+
+
 class ForecastIndex(Index):
     """
     An Xarray custom Index that allows indexing a forecast data-cube with
@@ -239,7 +411,13 @@ class ForecastIndex(Index):
     >>> newds.sel(forecast=ModelRun("2024-05-20 13:00"))
     """
 
-    def __init__(self, variables: Indexes, dummy_name: str, model: Model | None = None):
+    def __init__(
+        self,
+        variables: Indexes,
+        dummy_name: str,
+        model: Model | None = None,
+        cache: IndexCache | None = None,
+    ):
         self._indexes = variables
 
         assert isinstance(dummy_name, str)
@@ -248,6 +426,9 @@ class ForecastIndex(Index):
 
         # We use "reference_time", "period" as internal references.
         self.names = variables.get_names()
+        self._time_name, self._period_name = self.names["reference_time"], self.names["period"]
+
+        self._cache = IndexCache.from_indexes(variables, model) if cache is None else cache
 
     @classmethod
     def from_variables(cls, variables, options):
@@ -288,7 +469,7 @@ class ForecastIndex(Index):
                 f"indexing along {tuple(self.names)!r}"
             )
 
-        time_name, period_name = self.names["reference_time"], self.names["period"]
+        time_name, period_name = self._time_name, self._period_name
 
         # This allows normal `.sel` along `time_name` and `period_name` to work
         if time_name in labels or period_name in labels:
@@ -297,25 +478,40 @@ class ForecastIndex(Index):
                     f"Selecting along {time_name!r} or {period_name!r} cannot "
                     f"be combined with FMRC-style indexing along {self.dummy_name!r}."
                 )
+            # PandasIndex slicing returns a new object, so the unsliced one can be shared.
             time_index, period_index = self._indexes.reference_time, self._indexes.period
-            new_indexes = copy.deepcopy(self._indexes)
             results = []
+            time_idxr = period_idxr = None
             if time_name in labels:
                 result = time_index.sel({time_name: labels[time_name]}, **kwargs)
                 results.append(result)
-                idxr = result.dim_indexers[time_name]
-                new_indexes.reference_time = new_indexes.reference_time[idxr]
+                time_idxr = result.dim_indexers[time_name]
+                time_index = time_index[time_idxr]
             if period_name in labels:
                 result = period_index.sel({period_name: labels[period_name]}, **kwargs)
                 results.append(result)
-                idxr = result.dim_indexers[period_name]
-                new_indexes.period = new_indexes.period[idxr]
-            new_index = type(self)(new_indexes, dummy_name=self.dummy_name, model=self.model)
-            results.append(
-                IndexSelResult(
-                    {}, indexes={k: new_index for k in [self.dummy_name, time_name, period_name]}
-                )
+                period_idxr = result.dim_indexers[period_name]
+                period_index = period_index[period_idxr]
+            new_indexes = Indexes(reference_time=time_index, period=period_index)
+            new_index = type(self)(
+                new_indexes,
+                dummy_name=self.dummy_name,
+                model=self.model,
+                cache=self._cache.isel(new_indexes, time_idxr, period_idxr),
             )
+            new_xindexes = {k: new_index for k in [self.dummy_name, time_name, period_name]}
+            if len(results) == 1:
+                # Only one dimension was selected, so there is nothing to merge.
+                (result,) = results
+                return IndexSelResult(
+                    dim_indexers=result.dim_indexers,
+                    indexes={**result.indexes, **new_xindexes},
+                    variables=result.variables,
+                    drop_coords=result.drop_coords,
+                    drop_indexes=result.drop_indexes,
+                    rename_dims=result.rename_dims,
+                )
+            results.append(IndexSelResult({}, indexes=new_xindexes))
             return merge_sel_results(results)
 
         assert len(labels) == 1
@@ -324,50 +520,39 @@ class ForecastIndex(Index):
         label: ConstantOffset | ModelRun | ConstantForecast | BestEstimate
         label = next(iter(labels.values()))
 
+        handler = _SEL_HANDLERS.get(type(label))
+        if handler is None:
+            raise ValueError(f"Invalid indexer type {type(label)} for label: {label}")
+
         time_index: pd.DatetimeIndex = self._indexes.reference_time.index  # type: ignore[assignment]
         period_index: pd.TimedeltaIndex = self._indexes.period.index  # type: ignore[assignment]
 
-        time_idxr, period_idxr = label.get_indexer(self.model, time_index, period_index)
-
-        indexer, indexes, variables = {}, {}, {}
-        match label:
-            case ConstantOffset():
-                indexer[time_name] = time_idxr
-                indexer[period_name] = period_idxr
-                indexes[time_name] = self._indexes.reference_time[time_idxr]
-                valid_time_dim = time_name
-
-            case ModelRun():
-                indexer[time_name] = time_idxr
-                indexer[period_name] = period_idxr
-                indexes[period_name] = self._indexes.period[period_idxr]
-                valid_time_dim = period_name
-
-            case ConstantForecast():
-                indexer = {
-                    time_name: xr.Variable(time_name, time_idxr),
-                    period_name: xr.Variable(time_name, period_idxr),
-                }
-                indexes[time_name] = self._indexes.reference_time[time_idxr]
-                # TODO: this triggers a bug.
-                # variables["valid_time"] = xr.Variable((), label.time, {"standard_name": "time"})
-
-            case BestEstimate():
-                indexer = {
-                    time_name: xr.Variable("valid_time", time_idxr),
-                    period_name: xr.Variable("valid_time", period_idxr),
-                }
-                valid_time_dim = "valid_time"
-
-            case _:
-                raise ValueError(f"Invalid indexer type {type(label)} for label: {label}")
-
-        if not isinstance(label, ConstantForecast):
-            valid_time = time_index[time_idxr] + period_index[period_idxr]
+        time_idxr, period_idxr = label.get_indexer(
+            self.model, time_index, period_index, self._cache
+        )
+        indexer, indexes, variables, valid_time_dim = handler(
+            self._indexes, time_name, period_name, time_idxr, period_idxr
+        )
+
+        if valid_time_dim is not None:
+            if time_index.tz is None:
+                # Add the raw ndarrays rather than the pandas indexes to skip the Index wrappers.
+                valid_time = (
+                    self._cache.time_values[time_idxr] + self._cache.period_values[period_idxr]
+                )
+            else:
+                # The raw values are naive UTC; let pandas preserve the timezone.
+                valid_time = time_index[time_idxr] + period_index[period_idxr]
             variables["valid_time"] = xr.Variable(
                 valid_time_dim, data=valid_time, attrs={"standard_name": "time"}
             )
-            indexes["valid_time"] = PandasIndex(valid_time, dim=valid_time_dim)
+            # valid_time is freshly computed (a datetime64 ndarray, or a tz-aware
+            # DatetimeIndex whose dtype carries the timezone), so wrap it without a
+            # copy and skip PandasIndex's casting, renaming and dtype inference.
+            valid_time_index = pd.Index(valid_time, name=valid_time_dim, copy=False)
+            indexes["valid_time"] = PandasIndex(
+                valid_time_index, dim=valid_time_dim, coord_dtype=valid_time.dtype, fastpath=True
+            )
 
         return IndexSelResult(
             dim_indexers=indexer, indexes=indexes, variables=variables, drop_coords=["forecast"]